@@ -1,27 +1,230 @@
 # /// script
 # dependencies = [
 #   "ebooklib",
-#   "beautifulsoup4",
 #   "markdown"
 # ]
 # ///
 
+import functools
+import hashlib
+import html
+import io
 import os
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 import re
 import uuid
+import zipfile
 from pathlib import Path
-from typing import List, Optional
-import markdown
-from ebooklib import epub
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import quote, unquote
 import json
 import sys
 
+if TYPE_CHECKING:
+    import markdown
+
+
+_IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+    ".tiff": "image/tiff",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+}
+_IMAGE_EXTENSIONS = frozenset(_IMAGE_MEDIA_TYPES)
+
+# Formats that are already compressed and gain nothing from deflate
+_STORED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp"})
+
+_DIGITS_SPLIT = re.compile(r"(\d+)").split
+
+# Leading whitespace, blockquote and list markers of each line
+_LINE_PREFIX = re.compile(
+    r"^(?:[ \t>]|[*+-](?=[ \t])|\d{1,9}[.)](?=[ \t]))+", re.MULTILINE
+)
+
+# Bump when the cached chapter HTML would change for unchanged Markdown
+_CACHE_VERSION = 1
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_LINK_ATTR = re.compile(
+    r"""((?<![\w-])(?:src|href)\s*=\s*)(?:(["'])(.*?)\2|([^\s"'=<>`]+))""",
+    re.IGNORECASE | re.DOTALL,
+)
+# Path part and ?query/#fragment suffix of a URL
+_URL_SUFFIX = re.compile(r"([^?#]*)(.*)", re.DOTALL)
+
+
+def _number_sort_key(digits: str) -> str:
+    """Encode a digit run so that string order matches numeric order"""
+    number = str(int(digits))
+    return f"\0{len(number):04d}{number}"
+
+
+def _memoize_pygments_lookup(lookup):
+    """Cache a Pygments lexer/formatter lookup by name and options"""
+    cached_lookup = functools.lru_cache(maxsize=64)(lookup)
+
+    @functools.wraps(lookup)
+    def wrapper(name, **options):
+        try:
+            return cached_lookup(name, **options)
+        except TypeError:
+            # Unhashable options (e.g. hl_lines) bypass the cache
+            return lookup(name, **options)
+
+    return wrapper
+
+
+def _cache_codehilite_lookups():
+    """Reuse lexers and formatters across code blocks highlighted by codehilite"""
+    from markdown.extensions import codehilite
+
+    if not codehilite.pygments or hasattr(codehilite.get_lexer_by_name, "__wrapped__"):
+        return
+
+    codehilite.get_lexer_by_name = _memoize_pygments_lookup(
+        codehilite.get_lexer_by_name
+    )
+    codehilite.get_formatter_by_name = _memoize_pygments_lookup(
+        codehilite.get_formatter_by_name
+    )
+
+
+def _build_markdown(
+    highlight: bool = True, use_pygments: bool = True
+) -> "markdown.Markdown":
+    """Create the Markdown parser used for chapters, optionally without codehilite
+
+    With use_pygments disabled, code blocks are emitted as
+    <pre><code class="language-x"> for reader-side highlighting.
+    """
+    extensions = [
+        "markdown.extensions.sane_lists",
+        "markdown.extensions.extra",  # Support for tables, code blocks, and more.
+        "markdown.extensions.toc",  # Table of Contents
+        "markdown.extensions.meta",  # Metadata Support
+    ]
+    if highlight:
+        extensions.insert(2, "markdown.extensions.codehilite")  # Code Highlighting
+
+    import markdown
+
+    md = markdown.Markdown(
+        extensions=extensions,
+        extension_configs={
+            "markdown.extensions.codehilite": {
+                "css_class": "highlight",
+                "use_pygments": use_pygments,
+            },
+            "markdown.extensions.toc": {"permalink": True},
+        },
+    )
+    if highlight and use_pygments:
+        _cache_codehilite_lookups()
+    return md
+
+
+# Parsers owned by a worker process of add_markdown_directory
+_worker_parsers = {}
+
+
+def _may_contain_code(md_content: str) -> bool:
+    """Cheap, conservative check for fenced or indented code blocks"""
+    if "```" in md_content or "~~~" in md_content:
+        return True
+
+    # A tab or four spaces in a line's leading prefix may start an indented
+    # code block, including inside blockquotes and list items
+    for prefix in _LINE_PREFIX.findall(md_content):
+        if "\t" in prefix or prefix.count(" ") >= 4:
+            return True
+    return False
+
+
+def _file_signature(path: Path):
+    """Return (mtime, size) of a file, or None if it cannot be read"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _convert_markdown_file(
+    md_path: Path,
+    use_pygments: bool = True,
+    parsers: Optional[dict] = None,
+    chapter_title: Optional[str] = None,
+):
+    """Read a Markdown file and convert it, returning its title and HTML"""
+    if parsers is None:
+        parsers = _worker_parsers
+
+    with open(md_path, "r", encoding="utf-8") as f:
+        md_content = f.read()
+
+    # Only pay for codehilite when the chapter may contain a code block
+    highlight = _may_contain_code(md_content)
+    md = parsers.get((highlight, use_pygments))
+    if md is None:
+        md = _build_markdown(highlight, use_pygments)
+        parsers[highlight, use_pygments] = md
+
+    # Parse Markdown Content
+    html_content = md.convert(md_content)
+
+    # Reset Markdown Parser State
+    md.reset()
+
+    # Retrieve Chapter Title here so only the title leaves a worker
+    if not chapter_title:
+        chapter_title = MarkdownToEPUB._extract_title(md_content, md_path)
+
+    return chapter_title, html_content
+
+
+def _write_epub(output_path: str, book):
+    """Write the book, storing compressed images instead of deflating them"""
+    from ebooklib import epub
+
+    class EpubWriter(epub.EpubWriter):
+        def _write_items(self):
+            writestr = self.out.writestr
+
+            def write_item(name, data, *args, **kwargs):
+                if os.path.splitext(name)[1].lower() in _STORED_EXTENSIONS:
+                    kwargs.setdefault("compress_type", zipfile.ZIP_STORED)
+                writestr(name, data, *args, **kwargs)
+
+            self.out.writestr = write_item
+            try:
+                super()._write_items()
+            finally:
+                del self.out.writestr
+
+    writer = EpubWriter(output_path, book, {})
+    writer.process()
+    writer.write()
+
 
 class MarkdownToEPUB:
     """Markdown to EPUB Converter"""
 
-    def __init__(self, title="My Book", author="Unknown", language="zh"):
+    def __init__(
+        self,
+        title="My Book",
+        author="Unknown",
+        language="zh",
+        cache_dir: Optional[str] = None,
+        use_pygments: Optional[bool] = None,
+    ):
+        from ebooklib import epub
+
         self.book = epub.EpubBook()
         self.book.set_identifier(str(uuid.uuid4()))
         self.book.set_title(title)
@@ -30,26 +233,29 @@ class MarkdownToEPUB:
 
         self.chapters = []
         self.spine = ["nav"]
+        self._chapter_no = 0
+        self._lang = language
+
+        # Image content digest -> kept EpubImage, and duplicate file name ->
+        # (kept file name, duplicate EpubImage)
+        self._image_names = {}
+        self._image_aliases = {}
+
+        # Conversion caches to write back, keyed by cache file path
+        self.cache_dir = cache_dir
+        self._caches = {}
+
+        # Pygments highlighting is off by default on PyPy, where its
+        # tokenizers run before the JIT has warmed up
+        if use_pygments is None:
+            use_pygments = sys.implementation.name != "pypy"
+            if not use_pygments:
+                print("Running on PyPy: code blocks will not be syntax highlighted.")
 
         # Configure Markdown Parser
-        self.md = markdown.Markdown(
-            extensions=[
-                "markdown.extensions.sane_lists",
-                "markdown.extensions.extra",  # Support for tables, code blocks, and more.
-                "markdown.extensions.codehilite",  # Code Highlighting
-                "markdown.extensions.toc",  # Table of Contents
-                "markdown.extensions.meta",  # Metadata Support
-                "markdown.extensions.tables",  # Table Support
-                "markdown.extensions.fenced_code",  # Fencing code block
-            ],
-            extension_configs={
-                "markdown.extensions.codehilite": {
-                    "css_class": "highlight",
-                    "use_pygments": True,
-                },
-                "markdown.extensions.toc": {"permalink": True},
-            },
-        )
+        self.use_pygments = use_pygments
+        self.md = _build_markdown(use_pygments=use_pygments)
+        self._parsers = {(True, use_pygments): self.md}
 
         print(f"Initializing EPUB Converter: {title}")
 
@@ -59,58 +265,71 @@ class MarkdownToEPUB:
         """Add a single Markdown file as a chapter."""
 
         try:
-            with open(md_path, "r", encoding="utf-8") as f:
-                md_content = f.read()
-
-            # Parse Markdown Content
-            html_content = self.md.convert(md_content)
-
-            # Retrieve Chapter Title
-            if not chapter_title:
-                chapter_title = self._extract_title(md_content, md_path)
-
-            # Retrieve metadata (if available)
-            metadata = getattr(self.md, "Meta", {})
-
-            # Create Chapter
-            chapter_id = f"chapter_{len(self.chapters) + 1}"
-            chapter = epub.EpubHtml(
-                title=chapter_title,
-                file_name=f"{chapter_id}.xhtml",
-                lang=self.book.language,
+            chapter_title, html_content = _convert_markdown_file(
+                md_path, self.use_pygments, self._parsers, chapter_title
             )
+            self._add_chapter(md_path, chapter_title, html_content)
+            return True
 
-            # Set Chapter Content
-            chapter.content = self._create_xhtml_content(html_content, chapter_title)
+        except Exception as e:
+            print(f"✗ Failed to add file {md_path}: {e}")
+            return False
 
-            # Add to Books
-            self.book.add_item(chapter)
-            self.chapters.append(chapter)
-            self.spine.append(chapter)
+    def _add_chapter(self, md_path: Path, chapter_title: str, html_content: str):
+        """Add converted Markdown content as a chapter."""
+        from ebooklib import epub
 
-            print(f"✓ Chapter added: {chapter_title} ({md_path.name})")
+        # Create Chapter
+        self._chapter_no += 1
+        chapter = epub.EpubHtml(
+            title=chapter_title,
+            file_name=f"chapter_{self._chapter_no}.xhtml",
+            lang=self._lang,
+        )
 
-            # Reset Markdown Parser State
-            self.md.reset()
+        # Set Chapter Content; EpubHtml wraps it in an XHTML document with
+        # the title and stylesheet links when the book is written
+        chapter.content = html_content
 
-            return True
+        # Add to Books
+        self.book.add_item(chapter)
+        self.chapters.append(chapter)
+        self.spine.append(chapter)
 
-        except Exception as e:
-            print(f"✗ Failed to add file {md_path}: {e}")
-            return False
+        print(f"✓ Chapter added: {chapter_title} ({md_path.name})")
 
-    def add_image_file(self, img_path: Path, parent_path: str) -> bool:
+    def add_image_file(
+        self, img_path: Path, parent_path: str, image_content: Optional[bytes] = None
+    ) -> bool:
         """Add a single image."""
+        from ebooklib import epub
+
         try:
-            image_content = open(img_path, "rb").read()
+            if image_content is None:
+                with open(img_path, "rb") as f:
+                    image_content = f.read()
+
             prefix_len = len(parent_path) + 1
+            file_name = str(img_path)[prefix_len:]
+
+            # Identical content shares one buffer; the duplicate is dropped
+            # when the book is written if all its references were repointed
+            digest = hashlib.blake2b(image_content, digest_size=16).digest()
+            kept = self._image_names.get(digest)
+            if kept is not None:
+                image_content = kept.content
+
             img = epub.EpubImage(
                 uid=img_path.name,
-                file_name=str(img_path)[prefix_len:],
+                file_name=file_name,
                 media_type=self.image_media_type(img_path),
                 content=image_content,
             )
             self.book.add_item(img)
+            if kept is None:
+                self._image_names[digest] = img
+            else:
+                self._image_aliases[file_name] = (kept.file_name, img)
             return True
 
         except Exception as e:
@@ -118,32 +337,15 @@ class MarkdownToEPUB:
             return False
 
     def find_images_glob(self, directory):
-        """Use glob to recursively find images"""
-
-        image_patterns = [
-            "**/*.jpg",
-            "**/*.jpeg",
-            "**/*.png",
-            "**/*.gif",
-            "**/*.bmp",
-            "**/*.tiff",
-            "**/*.webp",
-            "**/*.svg",
-            "**/*.JPG",
-            "**/*.JPEG",
-            "**/*.PNG",
-            "**/*.GIF",
-            "**/*.BMP",
-            "**/*.TIFF",
-            "**/*.WEBP",
-            "**/*.SVG",
-        ]
+        """Recursively find images in a single directory walk"""
 
         image_files = []
-        for pattern in image_patterns:
-            image_files.extend(directory.glob(pattern))
+        for root, _, file_names in os.walk(directory):
+            for file_name in file_names:
+                if os.path.splitext(file_name)[1].lower() in _IMAGE_EXTENSIONS:
+                    image_files.append(Path(root, file_name))
 
-        return sorted(set(image_files))
+        return sorted(image_files)
 
     def add_markdown_directory(
         self, directory_path: str, pattern: str = "*.md"
@@ -160,7 +362,9 @@ class MarkdownToEPUB:
         md_files.extend(directory.glob("*.markdown"))
 
         # Sort by filename
-        md_files = sorted(set(md_files), key=lambda x: self._natural_sort_key(x.name))
+        md_files = sorted(
+            dict.fromkeys(md_files), key=lambda x: self._natural_sort_key(x.name)
+        )
 
         if not md_files:
             print(f"No Markdown files found in {directory_path}.")
@@ -168,23 +372,70 @@ class MarkdownToEPUB:
 
         print(f"Found {len(md_files)} Markdown files")
 
+        # Reuse conversions of files unchanged since the last run
+        cache_path = self._get_cache_path(directory)
+        cache = self._load_cache(cache_path)
+        new_cache = {}
+
+        # Convert changed files in worker processes, then assemble chapters in order
         success_count = 0
-        for md_file in md_files:
-            if self.add_markdown_file(md_file):
-                success_count += 1
+        max_workers = min(len(md_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            jobs = []
+            for md_file in md_files:
+                signature = _file_signature(md_file)
+                entry = cache.get(str(md_file))
+                if (
+                    isinstance(entry, tuple)
+                    and len(entry) == 3
+                    and entry[0] == signature
+                ):
+                    jobs.append((md_file, signature, entry[1:]))
+                else:
+                    future = executor.submit(
+                        _convert_markdown_file, md_file, self.use_pygments
+                    )
+                    jobs.append((md_file, signature, future))
+
+            for md_file, signature, job in jobs:
+                try:
+                    if isinstance(job, Future):
+                        job = job.result()
+                    chapter_title, html_content = job
+                    self._add_chapter(md_file, chapter_title, html_content)
+                    success_count += 1
+                except Exception as e:
+                    print(f"✗ Failed to add file {md_file}: {e}")
+                    continue
+
+                if signature is not None:
+                    new_cache[str(md_file)] = (signature, chapter_title, html_content)
+
+        if cache_path is not None:
+            self._caches[cache_path] = new_cache
 
         print(f"Found {len(md_files)} Markdown files.")
 
         # Find All Images
         img_files = self.find_images_glob(directory)
         print(f"Found {len(img_files)} Image files")
-        for img_file in img_files:
-            self.add_image_file(img_file, directory_path)
+
+        # Read images on a thread pool while the main thread embeds them
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(img_file.read_bytes) for img_file in img_files]
+            for img_file, future in zip(img_files, futures):
+                try:
+                    image_content = future.result()
+                except OSError as e:
+                    print(f"✗ Failed to add file {img_file}: {e}")
+                    continue
+                self.add_image_file(img_file, directory_path, image_content)
 
         return success_count > 0
 
     def add_custom_css(self, css_content: Optional[str] = None) -> bool:
         """Add custom CSS styles"""
+        from ebooklib import epub
 
         if css_content is None:
             css_content = self._get_default_css()
@@ -212,15 +463,11 @@ class MarkdownToEPUB:
 
     def image_media_type(self, image_path: Path) -> str:
         ext = image_path.suffix.lower()
-        if ext in [".jpg", ".jpeg"]:
-            return "image/jpeg"
-        elif ext == ".png":
-            return "image/png"
-        elif ext == ".gif":
-            return "image/gif"
-        else:
+        media_type = _IMAGE_MEDIA_TYPES.get(ext)
+        if media_type is None:
             print(f"Unsupported image format: {ext}")
-            return "image/png"
+            return "application/octet-stream"
+        return media_type
 
     def add_cover_image(self, image_path: str) -> bool:
         """Add cover image"""
@@ -247,61 +494,139 @@ class MarkdownToEPUB:
             print(f"✗ Failed to add cover: {e}")
             return False
 
-    def _extract_title(self, md_content: str, md_path: Path) -> str:
+    @staticmethod
+    def _extract_title(md_content: str, md_path: Path) -> str:
         """Extract titles from Markdown content"""
 
-        lines = md_content.split("\n")
+        # Read lines lazily; titles sit near the top of long chapters
+        lines = io.StringIO(md_content, newline="\n")
 
         # Locate the title in the YAML front matter
-        if lines and lines[0].strip() == "---":
-            yaml_end = -1
-            for i, line in enumerate(lines[1:], 1):
+        if lines.readline().strip() == "---":
+            yaml_lines = []
+            for line in lines:
                 if line.strip() == "---":
-                    yaml_end = i
+                    try:
+                        yaml_content = "".join(yaml_lines)
+                        metadata = yaml.safe_load(yaml_content)
+                        if isinstance(metadata, dict) and "title" in metadata:
+                            return str(metadata["title"])
+                    except:
+                        pass
                     break
-
-            if yaml_end > 0:
-                try:
-                    yaml_content = "\n".join(lines[1:yaml_end])
-                    metadata = yaml.safe_load(yaml_content)
-                    if isinstance(metadata, dict) and "title" in metadata:
-                        return str(metadata["title"])
-                except:
-                    pass
+                yaml_lines.append(line)
 
         # Find the First H1 Heading
-        for line in lines:
+        lines.seek(0)
+        line = lines.readline()
+        while line:
+            next_line = lines.readline()
             line = line.strip()
             if line.startswith("# "):
                 return line[2:].strip()
-            elif line and lines.index(line) + 1 < len(lines):
-                next_line = lines[lines.index(line) + 1].strip()
-                if next_line and all(c == "=" for c in next_line):
+            elif line:
+                underline = next_line.strip()
+                if underline and not underline.strip("="):
                     return line
+            line = next_line
 
         # Use the Filename as the Title
         return md_path.stem.replace("_", " ").replace("-", " ").title()
 
-    def _create_xhtml_content(self, html_content: str, title: str) -> str:
-        """Create XHTML content that conforms to the EPUB standard."""
+    def _relink_images(self):
+        """Point references at kept copies and drop unreferenced duplicates"""
+
+        def relink_attr(match):
+            quote_char = match.group(2)
+            url = match.group(3) if quote_char else match.group(4)
+            path, suffix = _URL_SUFFIX.match(url).groups()
+            name = unquote(html.unescape(path)).removeprefix("./")
+            alias = self._image_aliases.get(name)
+            if alias is None:
+                return match.group(0)
+            quote_char = quote_char or '"'
+            return f"{match.group(1)}{quote_char}{quote(alias[0])}{suffix}{quote_char}"
+
+        def relink_tag(match):
+            return _LINK_ATTR.sub(relink_attr, match.group(0))
+
+        for chapter in self.chapters:
+            chapter.content = _HTML_TAG.sub(relink_tag, chapter.content)
+
+        # Anything the rewrite missed (srcset, CSS url(), ...) still names
+        # the duplicate, which then keeps its own copy in the book
+        texts = []
+        for item in self.book.get_items():
+            if item.media_type in ("application/xhtml+xml", "text/css"):
+                content = item.content
+                if isinstance(content, bytes):
+                    content = content.decode("utf-8", errors="ignore")
+                texts.append(content or "")
+        texts = "\n".join(texts)
+
+        for file_name, (_, img) in self._image_aliases.items():
+            forms = {file_name, quote(file_name)}
+            forms.update([html.escape(form) for form in forms])
+            if not any(form in texts for form in forms):
+                self.book.items.remove(img)
+
+    def _get_cache_path(self, directory: Path) -> Optional[Path]:
+        """Locate the conversion cache file for a Markdown directory"""
+        if self.cache_dir is None:
+            return None
+
+        # Highlighted and plain conversions are cached separately
+        source = f"{directory.resolve()}:{self.use_pygments}"
+        key = hashlib.blake2b(source.encode(), digest_size=8)
+        return Path(self.cache_dir) / f"{key.hexdigest()}.pickle"
+
+    def _load_cache(self, cache_path: Optional[Path]) -> dict:
+        """Load cached conversions: path -> (signature, title, html)"""
+        if cache_path is None:
+            return {}
 
-        # Clean HTML Content
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        cleaned_content = str(soup)
-        return cleaned_content
+        try:
+            with open(cache_path, "rb") as f:
+                cache = pickle.load(f)
+        except Exception:
+            return {}
+
+        # Ignore caches written by another version or not by this script
+        if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+            return {}
+        chapters = cache.get("chapters")
+        if not isinstance(chapters, dict):
+            return {}
+        return chapters
+
+    def _save_caches(self):
+        """Write conversion caches back to disk"""
+        for cache_path, chapters in self._caches.items():
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, "wb") as f:
+                    pickle.dump({"version": _CACHE_VERSION, "chapters": chapters}, f)
+            except Exception as e:
+                print(f"✗ Failed to write cache {cache_path}: {e}")
 
     def _get_default_css(self) -> str:
         """Retrieve the default CSS styles"""
         with open("./default.css", "r", encoding="utf-8") as f:
             return f.read()
 
-    def _natural_sort_key(self, text: str) -> List:
+    def _natural_sort_key(self, text: str) -> str:
         """Natural sorting key function"""
-        return [int(c) if c.isdigit() else c.lower() for c in re.split(r"(\d+)", text)]
+        # Flatten to one string so sorting compares keys in a single step.
+        # Digit runs become NUL, their digit count and the digits, which
+        # orders the same way as comparing [str, int, str, ...] parts did.
+        return "".join(
+            _number_sort_key(c) if c.isdigit() else c.lower()
+            for c in _DIGITS_SPLIT(text)
+        )
 
     def generate_epub(self, output_path: str) -> bool:
         """Generate EPUB file"""
+        from ebooklib import epub
 
         try:
             if not self.chapters:
@@ -311,6 +636,10 @@ class MarkdownToEPUB:
             # Add default styles
             self.add_custom_css()
 
+            # Point references to duplicate images at the embedded copy
+            if self._image_aliases:
+                self._relink_images()
+
             # Create Directory
             self.book.toc = [
                 (epub.Link(chapter.file_name, chapter.title, chapter.id), [])
@@ -329,7 +658,10 @@ class MarkdownToEPUB:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write to the EPUB file
-            epub.write_epub(str(output_path), self.book, {})
+            _write_epub(str(output_path), self.book)
+
+            # Keep conversions for the next run
+            self._save_caches()
 
             print(f"🎉 EPUB file has been successfully generated: {output_path}")
             print(f"📚 Contains {len(self.chapters)} chapters")
@@ -356,6 +688,7 @@ def main():
     markdown_dir = str(Path(markdown_dir))
     title = markdown_dir.split("/")[-1]
     output_file = f"./output/{title}.epub"
+    cache_dir = "./output/.cache"
     author = "Unknown"
 
     language = "en"
@@ -378,7 +711,9 @@ def main():
     print("🚀 Starting the conversion of Markdown files to EPUB...")
 
     # Create a Converter
-    converter = MarkdownToEPUB(title=title, author=author, language=language)
+    converter = MarkdownToEPUB(
+        title=title, author=author, language=language, cache_dir=cache_dir
+    )
 
     # Add Markdown Files
     if not converter.add_markdown_directory(markdown_dir):